@@ -0,0 +1,63 @@
+import datetime
+import zoneinfo
+
+import polars as pl
+
+from ts.calendar import CME_GLOBEX, SessionCalendar
+
+
+def chicago(*args) -> datetime.datetime:
+    return datetime.datetime(*args, tzinfo=zoneinfo.ZoneInfo(key="America/Chicago"))
+
+
+def session_ids(calendar: SessionCalendar, timestamps: list) -> list:
+    return (
+        pl.DataFrame({"timestamp": timestamps})
+        .select(calendar.session_id("timestamp"))
+        .to_series()
+        .to_list()
+    )
+
+
+class TestSessionCalendar:
+    def test_default_utc_day(self):
+        timestamps = [
+            datetime.datetime(2019, 12, 2, 0, 0),
+            datetime.datetime(2019, 12, 2, 23, 59),
+            datetime.datetime(2019, 12, 7, 12, 0),
+        ]
+        assert session_ids(SessionCalendar(), timestamps) == [18232, 18232, 18237]
+
+    def test_overnight_session(self):
+        # Sunday evening opens Monday's session, Friday evening is closed
+        timestamps = [
+            chicago(2019, 12, 1, 16, 30),
+            chicago(2019, 12, 1, 17, 30),
+            chicago(2019, 12, 2, 15, 0),
+            chicago(2019, 12, 2, 16, 30),
+            chicago(2019, 12, 6, 17, 30),
+        ]
+        assert session_ids(CME_GLOBEX, timestamps) == [
+            None,
+            18232,
+            18232,
+            None,
+            None,
+        ]
+
+    def test_breaks_and_holidays(self):
+        calendar = SessionCalendar(
+            timezone="America/Chicago",
+            open=datetime.time(8, 30),
+            close=datetime.time(15, 0),
+            breaks=[(datetime.time(12, 0), datetime.time(12, 30))],
+            holidays=[datetime.date(2019, 12, 25)],
+        )
+        timestamps = [
+            chicago(2019, 12, 2, 8, 0),
+            chicago(2019, 12, 2, 11, 59),
+            chicago(2019, 12, 2, 12, 15),
+            chicago(2019, 12, 2, 12, 30),
+            chicago(2019, 12, 25, 10, 0),
+        ]
+        assert session_ids(calendar, timestamps) == [None, 18232, None, 18232, None]
@@ -0,0 +1,92 @@
+import datetime
+import os
+
+import polars as pl
+import pytest
+
+from ts.dataset import (
+    ROW_GROUP_BYTES,
+    read_dataset,
+    read_manifest,
+    row_group_size,
+    write_dataset,
+)
+
+
+def make_ticks(day: int) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "timestamp": [
+                datetime.datetime(2019, 12, day, 9, 30),
+                datetime.datetime(2019, 12, day, 15, 0),
+            ],
+            "side": [0, 1],
+            "price": [19094.0 + day, 19096.0 + day],
+            "quantity": [1, 2],
+        }
+    )
+
+
+class TestDataset:
+    def test_partitions(self, tmp_path):
+        root = str(tmp_path)
+        dates = write_dataset(
+            pl.concat([make_ticks(4), make_ticks(5)]),
+            root=root,
+            supplier="tick-CME-HO",
+            instrument="CME-HO",
+            timestamp_col="timestamp",
+        )
+        assert dates == ["2019-12-04", "2019-12-05"]
+        assert os.path.isdir(
+            os.path.join(
+                root, "supplier=tick-CME-HO", "instrument=CME-HO", "date=2019-12-05"
+            )
+        )
+
+        entry = read_manifest(root)["partitions"][0]
+        assert entry["statistics"]["rows"] == 2
+        assert entry["statistics"]["columns"]["price"] == {
+            "min": 19098.0,
+            "max": 19100.0,
+        }
+
+    def test_row_group_size(self):
+        ticks = make_ticks(4)
+        wide = ticks.with_columns([pl.col("price").alias(f"f{i}") for i in range(20)])
+        assert row_group_size(wide) < row_group_size(ticks)
+        assert row_group_size(ticks) * ticks.estimated_size() / 2 <= ROW_GROUP_BYTES
+
+    def test_append(self, tmp_path):
+        root = str(tmp_path)
+        write_dataset(make_ticks(4), root, "tick-CME-HO", "CME-HO", "timestamp")
+        path = os.path.join(root, read_manifest(root)["partitions"][0]["path"])
+        mtime = os.stat(path).st_mtime_ns
+
+        write_dataset(make_ticks(5), root, "tick-CME-HO", "CME-HO", "timestamp")
+        assert os.stat(path).st_mtime_ns == mtime
+        assert len(read_manifest(root)["partitions"]) == 2
+        assert read_dataset(root, "tick-CME-HO").height == 4
+
+    def test_schema_mismatch(self, tmp_path):
+        root = str(tmp_path)
+        write_dataset(make_ticks(4), root, "tick-CME-HO", "CME-HO", "timestamp")
+        with pytest.raises(ValueError):
+            write_dataset(
+                make_ticks(5).drop("side"), root, "tick-CME-HO", "CME-HO", "timestamp"
+            )
+
+    def test_read_pruning(self, tmp_path):
+        root = str(tmp_path)
+        write_dataset(make_ticks(4), root, "tick", "CME-HO", "timestamp")
+        write_dataset(make_ticks(5), root, "tick", "CME-HO", "timestamp")
+        write_dataset(make_ticks(5), root, "tick", "CME-NG", "timestamp")
+        write_dataset(make_ticks(5).drop("side"), root, "bar", "CME-HO", "timestamp")
+
+        data = read_dataset(root, "tick", start="2019-12-05", columns=["price"])
+        assert data.columns == ["price", "supplier", "instrument", "date"]
+        assert data["instrument"].to_list() == ["CME-HO"] * 2 + ["CME-NG"] * 2
+        assert data["price"].to_list() == [19099.0, 19101.0, 19099.0, 19101.0]
+
+        with pytest.raises(ValueError):
+            read_dataset(root, "tick", instruments=["CME-CL"])
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from ts.functions import FILTERS, ewma_weights, fft_convolve, frac_diff_weights
+from ts.supplier import Function
+
+
+def direct_convolve(values: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    window_size = len(kernel)
+    out = np.full(values.shape, np.nan)
+    for t in range(window_size - 1, len(values)):
+        out[t] = kernel @ values[t - window_size + 1 : t + 1][::-1]
+    return out
+
+
+class TestFunctions:
+    def test_frac_diff_weights(self):
+        assert frac_diff_weights(1, 3).tolist() == [1.0, -1.0, 0.0]
+        assert np.allclose(frac_diff_weights(0.5, 3), [1.0, -0.5, -0.125])
+
+    def test_ewma_weights(self):
+        assert np.isclose(ewma_weights(0.1, 100, n_chain=3).sum(), 1)
+
+    @pytest.mark.parametrize(
+        "n, window_size, fft_size", [(10, 3, None), (1_000, 100, None), (500, 64, 64)]
+    )
+    def test_fft_convolve(self, n, window_size, fft_size):
+        values = np.random.default_rng(0).normal(size=(n, 3))
+        kernel = frac_diff_weights(0.4, window_size)
+
+        out = fft_convolve(values, kernel, fft_size=fft_size)
+        for i in range(values.shape[1]):
+            assert np.allclose(
+                out[:, i], direct_convolve(values[:, i], kernel), equal_nan=True
+            )
+
+    def test_fft_convolve_non_finite(self):
+        values = np.arange(10, dtype=np.float64)
+        values[5] = np.nan
+
+        out = fft_convolve(values, np.ones(2))
+        assert np.isnan(out).nonzero()[0].tolist() == [0, 5, 6]
+        assert out[9] == 17
+
+    def test_fft_convolve_empty(self):
+        assert fft_convolve(np.empty(0), np.ones(5)).shape == (0,)
+        assert fft_convolve(np.empty((0, 2)), np.ones(5)).shape == (0, 2)
+
+    def test_filters(self):
+        assert sorted(FILTERS) == sorted(
+            [Function.FRAC_DIFF, Function.EWMA, Function.FIR]
+        )
+        with pytest.raises(ValueError):
+            FILTERS[Function.FIR](3, kernel=np.ones(2))
@@ -1,9 +1,12 @@
 import datetime
 import zoneinfo
 
+import numpy as np
 import polars as pl
 import pytest
 
+from ts.calendar import SessionCalendar
+from ts.functions import frac_diff_weights
 from ts.supplier import (
     Bar,
     BarAggregation,
@@ -12,8 +15,10 @@ from ts.supplier import (
     BarSupplier,
     Function,
     MultiplexSupplier,
+    QuarantineReason,
     RollingFeatureSupplier,
     TickSupplier,
+    TradeTick,
 )
 
 
@@ -88,6 +93,98 @@ def bar_suppliers():
     ]
 
 
+def eastern(*args) -> datetime.datetime:
+    return datetime.datetime(*args, tzinfo=zoneinfo.ZoneInfo(key="US/Eastern"))
+
+
+class TestTickSupplier:
+    def test_as_of(self, tick_supplier):
+        assert tick_supplier.as_of(eastern(2019, 12, 4, 8, 56, 5))[
+            TradeTick.PRICE
+        ].to_list() == [19096.0]
+        assert tick_supplier.as_of(eastern(2019, 12, 4, 8, 0)).is_empty()
+
+    def test_between(self, tick_supplier):
+        data = tick_supplier.between(
+            eastern(2019, 12, 4, 8, 56, 2), eastern(2019, 12, 4, 8, 56, 19)
+        )
+        assert data[TradeTick.PRICE].to_list() == [19096.0, 19100.0]
+
+    def test_last_n(self, tick_supplier):
+        data = tick_supplier.last_n(eastern(2019, 12, 4, 8, 56, 19), 3)
+        assert data[TradeTick.PRICE].to_list() == [19094.0, 19096.0, 19100.0]
+
+    def test_as_of_many(self, tick_supplier):
+        data = tick_supplier.as_of_many(
+            [eastern(2019, 12, 4, 8, 0), eastern(2019, 12, 4, 9, 0)]
+        )
+        assert data[TradeTick.PRICE].to_list() == [None, 19097.0]
+
+    def test_bars_keep_tick_data(self, tick_supplier, tmp_path):
+        data = tick_supplier.data
+        tick_supplier.as_of(eastern(2019, 12, 4, 9, 0))
+        tick_supplier.to_dataset(str(tmp_path))
+
+        BarSupplier(tick_supplier, bar_aggregation=BarAggregation.VOLUME, size=1)
+        assert tick_supplier.data is data
+        assert tick_supplier.is_sorted
+
+        # the next day's ticks still match the stored schema
+        tick_supplier.data = data.with_columns(
+            pl.col(TradeTick.TIMESTAMP).dt.offset_by("1d")
+        )
+        assert tick_supplier.to_dataset(str(tmp_path)) == ["2019-12-05"]
+
+    def test_dataset(self, tick_supplier, tmp_path):
+        assert tick_supplier.to_dataset(str(tmp_path)) == ["2019-12-04"]
+
+        supplier = TickSupplier(instrument="CME-HO")
+        supplier.from_dataset(str(tmp_path), columns=[TradeTick.TIMESTAMP])
+        assert supplier.data.frame_equal(tick_supplier.data.select(TradeTick.TIMESTAMP))
+
+    def test_clean(self, tick_supplier):
+        data = tick_supplier.data
+        tick_supplier.data = pl.concat(
+            [
+                data.reverse(),
+                data[2].with_columns(pl.lit(2).cast(pl.Int64).alias(TradeTick.SIDE)),
+                data[3].with_columns(
+                    pl.lit(0).cast(pl.Int64).alias(TradeTick.QUANTITY)
+                ),
+                data[4],
+                data[1].with_columns(pl.lit(30000.0).alias(TradeTick.PRICE)),
+            ]
+        )
+        quarantine = tick_supplier.clean()
+
+        assert tick_supplier.is_sorted
+        assert tick_supplier.data.frame_equal(data)
+        assert quarantine["row_nr"].to_list() == [5, 6, 7, 8]
+        assert quarantine["reason"].to_list() == [
+            QuarantineReason.UNKNOWN_SIDE,
+            QuarantineReason.NON_POSITIVE_QUANTITY,
+            QuarantineReason.DUPLICATE,
+            QuarantineReason.PRICE_SPIKE,
+        ]
+
+    def test_clean_integer_price(self, tick_supplier):
+        tick_supplier.data = tick_supplier.data.with_columns(
+            pl.col(TradeTick.PRICE).cast(pl.Int64)
+        )
+        assert tick_supplier.clean().is_empty()
+        assert tick_supplier.is_clean
+
+    def test_unsorted(self, tick_supplier):
+        tick_supplier.as_of(eastern(2019, 12, 4, 9, 0))
+        assert tick_supplier.is_sorted
+
+        # reassigning data invalidates the sorted flag
+        tick_supplier.data = tick_supplier.data.reverse()
+        assert not tick_supplier.is_sorted
+        with pytest.raises(ValueError):
+            tick_supplier.as_of(eastern(2019, 12, 4, 9, 0))
+
+
 class TestBarSupplier:
     def test_instruments(self, tick_supplier):
         bar_supplier = BarSupplier(
@@ -115,24 +212,117 @@ class TestBarSupplier:
         # first bar has the wrong size due to our cumsum group-by aggregation
         assert bar_supplier.data[volume_col].to_list() == [1, 2, 2]
 
+    def test_bar_aggregation_volume_uncleaned(self, tick_supplier):
+        # sorted but not cleaned ticks may still produce out of order buckets
+        tick_supplier.data = tick_supplier.data.with_columns(
+            pl.Series(TradeTick.QUANTITY, [2, -1, 1, 1, 1])
+        )
+        tick_supplier.as_of(eastern(2019, 12, 4, 9, 0))
+        bar_supplier = BarSupplier(
+            tick_supplier, bar_aggregation=BarAggregation.VOLUME, size=1
+        )
+        timestamps = bar_supplier.data[bar_supplier.timestamp_col]
+        assert timestamps.to_list() == sorted(timestamps.to_list())
+
     def test_bar_aggregation_time(self, tick_supplier):
         bar_supplier = BarSupplier(
             tick_supplier, bar_aggregation=BarAggregation.TIME_SECONDS, size=30
         )
         assert len(bar_supplier.data) == 3
 
+    def test_bar_aggregation_time_sessions(self, tick_supplier):
+        BarSupplier(tick_supplier, bar_aggregation=BarAggregation.VOLUME, size=1)
+
+        # a session opening at 08:56:10 splits the 08:56:00 bar in two
+        tick_supplier.session_calendar = SessionCalendar(
+            timezone="US/Eastern",
+            open=datetime.time(8, 56, 10),
+            close=datetime.time(8, 56, 10),
+        )
+        bar_supplier = BarSupplier(
+            tick_supplier, bar_aggregation=BarAggregation.TIME_SECONDS, size=30
+        )
+        volume_col = bar_supplier.get_col(Bar, Bar.VOLUME)
+        session_col = bar_supplier.get_col(Bar, Bar.SESSION)
+        assert bar_supplier.data[volume_col].to_list() == [2, 1, 1, 1]
+        assert bar_supplier.data[session_col].n_unique() == 2
+
+    def test_dataset(self, tick_supplier, tmp_path):
+        bar_suppliers = [
+            BarSupplier(tick_supplier, bar_aggregation=BarAggregation.VOLUME, size=size)
+            for size in [1, 2]
+        ]
+        for bar_supplier in bar_suppliers:
+            bar_supplier.to_dataset(str(tmp_path))
+
+        # bars are read back without the ticks
+        for size, bar_supplier in zip([1, 2], bar_suppliers):
+            loaded = BarSupplier.from_dataset(
+                str(tmp_path),
+                "CME-HO",
+                bar_aggregation=BarAggregation.VOLUME,
+                size=size,
+            )
+            assert loaded.alias == bar_supplier.alias
+            assert loaded.data.frame_equal(bar_supplier.data)
+
+    def test_features_dataset(self, barfeature_supplier, tmp_path):
+        barfeature_supplier.to_dataset(str(tmp_path))
+
+        loaded = BarFeatureSupplier.from_dataset(
+            str(tmp_path), "CME-HO", bar_aggregation=BarAggregation.VOLUME, size=1
+        )
+        assert loaded.data.frame_equal(barfeature_supplier.data)
+        assert loaded.bars == barfeature_supplier.bars
+        assert loaded.supplier.data.columns == barfeature_supplier.supplier.data.columns
+
+    def test_features_without_session(self, bar_supplier):
+        bar_supplier.data = bar_supplier.data.drop(
+            bar_supplier.get_col(Bar, Bar.SESSION)
+        )
+        supplier = BarFeatureSupplier(supplier=bar_supplier)
+        column = supplier.get_col(BarFeature, BarFeature.CUMULATIVE_VOLUME_DELTA)
+        assert supplier.data[column].to_list() == [-1, -2, -3, -4, -5]
+
+    def test_cumulative_volume_delta(self, barfeature_supplier):
+        column = barfeature_supplier.get_col(
+            BarFeature, BarFeature.CUMULATIVE_VOLUME_DELTA
+        )
+        assert barfeature_supplier.data[column].to_list() == [-1, -2, -3, -4, -5]
+
+    def test_as_of(self, barfeature_supplier):
+        assert barfeature_supplier.is_sorted
+        data = barfeature_supplier.as_of(eastern(2019, 12, 4, 8, 56, 5))
+        assert data[barfeature_supplier.timestamp_col].to_list() == [
+            eastern(2019, 12, 4, 8, 56, 2)
+        ]
+
 
 class TestMultiplexSupplier:
+    def test_dataset(self, bar_suppliers, tmp_path):
+        multiplex_supplier = MultiplexSupplier(suppliers=bar_suppliers)
+        with pytest.raises(ValueError):
+            multiplex_supplier.to_dataset(str(tmp_path))
+
     def test_instruments(self, bar_suppliers):
         multiplex_supplier = MultiplexSupplier(suppliers=bar_suppliers)
         assert multiplex_supplier.instruments == ["CME-HO", "CME-NG"]
 
     def test_data(self, bar_suppliers):
         multiplex_supplier = MultiplexSupplier(suppliers=bar_suppliers)
-        assert len(multiplex_supplier.data.columns) == 22
+        assert len(multiplex_supplier.data.columns) == 24
 
 
 class TestRollingFeatureSupplier:
+    def test_dataset(self, barfeature_supplier, tmp_path):
+        rolling_feat = RollingFeatureSupplier(
+            barfeature_supplier,
+            functions=[Function.Z_SCORE],
+            type_attributes=[BarFeature.OFI],
+        )
+        assert rolling_feat.instruments == ["CME-HO"]
+        assert rolling_feat.to_dataset(str(tmp_path)) == ["2019-12-04"]
+
     def test_z_score(self, barfeature_supplier):
         rolling_feat = RollingFeatureSupplier(
             barfeature_supplier,
@@ -143,3 +333,40 @@ class TestRollingFeatureSupplier:
             "rolling_features-bar_features-bar-CME-HO-volume_agg-1-ofi-z_score-10"
             in rolling_feat.data.columns
         )
+
+    def test_frac_diff(self, barfeature_supplier):
+        rolling_feat = RollingFeatureSupplier(
+            barfeature_supplier,
+            functions=[Function.FRAC_DIFF],
+            type_attributes=[BarFeature.OFI],
+            window_size=2,
+            function_kwargs={Function.FRAC_DIFF: {"d": 1}},
+        )
+        column = "rolling_features-bar_features-bar-CME-HO-volume_agg-1-ofi-frac_diff-2"
+        assert rolling_feat.data[column][0] is None
+        assert rolling_feat.data[column][1:].to_list() == pytest.approx([0.0] * 4)
+
+    def test_frac_diff_close(self, barfeature_supplier):
+        rolling_feat = RollingFeatureSupplier(
+            barfeature_supplier,
+            functions=[Function.FRAC_DIFF],
+            type_attributes=[Bar.CLOSE],
+            window_size=2,
+            function_kwargs={Function.FRAC_DIFF: {"d": 0.4}},
+        )
+        close = rolling_feat.data["bar-CME-HO-volume_agg-1-close"].to_numpy()
+        expected = np.convolve(close, frac_diff_weights(0.4, 2))[1 : len(close)]
+
+        column = "rolling_features-bar-CME-HO-volume_agg-1-close-frac_diff-2"
+        assert rolling_feat.data[column][0] is None
+        assert rolling_feat.data[column][1:].to_list() == pytest.approx(expected)
+
+    @pytest.mark.parametrize("function", [Function.FRAC_DIFF, Function.FIR])
+    def test_missing_function_kwargs(self, barfeature_supplier, function):
+        with pytest.raises(ValueError, match="missing a required argument"):
+            RollingFeatureSupplier(
+                barfeature_supplier,
+                functions=[function],
+                type_attributes=[Bar.CLOSE],
+                window_size=2,
+            )
@@ -0,0 +1,81 @@
+import datetime
+
+import polars as pl
+
+DAY_MS = 86_400_000
+# 1970-01-01 was a Thursday
+EPOCH_WEEKDAY = 3
+
+
+def _time_ms(time: datetime.time) -> int:
+    seconds = (time.hour * 60 + time.minute) * 60 + time.second
+    return seconds * 1_000 + time.microsecond // 1_000
+
+
+class SessionCalendar:
+    """Trading sessions of an exchange/instrument in its local timezone.
+
+    A session opens at `open` and closes at `close` local time; sessions closing
+    on or before their open wrap past midnight. Sessions are labelled by the
+    local date they close on, as days since epoch, and only kept if that date
+    falls on one of `weekdays` (0 = Monday) and is not in `holidays`.
+    Timestamps within `breaks` (local (start, end) times) belong to no session.
+    """
+
+    def __init__(
+        self,
+        timezone: str = "UTC",
+        open: datetime.time = datetime.time(0),
+        close: datetime.time = datetime.time(0),
+        breaks: list[tuple[datetime.time, datetime.time]] | None = None,
+        weekdays: list[int] | None = None,
+        holidays: list[datetime.date] | None = None,
+    ):
+        self.timezone = timezone
+        self.open = open
+        self.close = close
+        self.breaks = breaks or []
+        self.weekdays = list(range(7)) if weekdays is None else weekdays
+        self.holidays = holidays or []
+
+        self._open_ms = _time_ms(open)
+        self._duration_ms = (_time_ms(close) - self._open_ms) % DAY_MS or DAY_MS
+        # days between the session open and the local date it closes on
+        self._close_day = (self._open_ms + self._duration_ms - 1) // DAY_MS
+
+    def session_id(self, column: str) -> pl.Expr:
+        """Int32 session id of each timestamp in column, null outside sessions."""
+        # local wall-clock milliseconds, shifted so sessions start at 0
+        shifted = (
+            pl.col(column)
+            .dt.with_time_zone(self.timezone)
+            .dt.cast_time_zone("UTC")
+            .dt.epoch(tu="ms")
+            - self._open_ms
+        )
+        offset = shifted % DAY_MS
+        session = (shifted - offset) // DAY_MS + self._close_day
+
+        in_session = offset < self._duration_ms
+        for start, end in self.breaks:
+            start = (_time_ms(start) - self._open_ms) % DAY_MS
+            end = (_time_ms(end) - self._open_ms) % DAY_MS
+            in_session = in_session & ~((offset >= start) & (offset < end))
+
+        in_session = in_session & ((session + EPOCH_WEEKDAY) % 7).is_in(self.weekdays)
+        if self.holidays:
+            epoch = datetime.date(1970, 1, 1)
+            in_session = in_session & ~session.is_in(
+                [(holiday - epoch).days for holiday in self.holidays]
+            )
+
+        return pl.when(in_session).then(session.cast(pl.Int32)).otherwise(None)
+
+
+# CME Globex: Sunday-Friday 17:00-16:00 CT, maintenance break in between
+CME_GLOBEX = SessionCalendar(
+    timezone="America/Chicago",
+    open=datetime.time(17),
+    close=datetime.time(16),
+    weekdays=[0, 1, 2, 3, 4],
+)
@@ -0,0 +1,146 @@
+import json
+import os
+
+import polars as pl
+from polars.datatypes import NUMERIC_DTYPES
+
+MANIFEST = "_manifest.json"
+PARTITION_FILE = "part-0.parquet"
+# hive partition keys, added back as columns by read_dataset
+PARTITION_KEYS = ["supplier", "instrument", "date"]
+
+# in-memory size targeted per parquet row group
+ROW_GROUP_BYTES = 64 * 2**20
+
+
+def partition_path(root: str, supplier: str, instrument: str, date: str) -> str:
+    return os.path.join(
+        root, f"supplier={supplier}", f"instrument={instrument}", f"date={date}"
+    )
+
+
+def row_group_size(data: pl.DataFrame) -> int:
+    """Rows per row group so that each holds about ROW_GROUP_BYTES.
+
+    Wide bar feature frames get fewer rows per group than narrow tick frames.
+    """
+    bytes_per_row = data.estimated_size() / max(data.height, 1)
+    return max(int(ROW_GROUP_BYTES // max(bytes_per_row, 1)), 1)
+
+
+def read_manifest(root: str) -> dict:
+    filepath = os.path.join(root, MANIFEST)
+    if not os.path.exists(filepath):
+        return {"partitions": []}
+
+    with open(filepath) as f:
+        return json.load(f)
+
+
+def _write_manifest(root: str, manifest: dict):
+    filepath = os.path.join(root, MANIFEST)
+    with open(f"{filepath}.tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(f"{filepath}.tmp", filepath)
+
+
+def _partition_statistics(data: pl.DataFrame, timestamp_col: str) -> dict:
+    numeric_cols = [
+        col for col, dtype in zip(data.columns, data.dtypes) if dtype in NUMERIC_DTYPES
+    ]
+    mins = data.select([pl.col(numeric_cols).min()]).row(0) if numeric_cols else []
+    maxs = data.select([pl.col(numeric_cols).max()]).row(0) if numeric_cols else []
+    return {
+        "rows": data.height,
+        "min_timestamp": str(data[timestamp_col].min()),
+        "max_timestamp": str(data[timestamp_col].max()),
+        "columns": {
+            col: {"min": col_min, "max": col_max}
+            for col, col_min, col_max in zip(numeric_cols, mins, maxs)
+        },
+    }
+
+
+def write_dataset(
+    data: pl.DataFrame, root: str, supplier: str, instrument: str, timestamp_col: str
+) -> list[str]:
+    """Writes data as supplier=/instrument=/date= partitions of root.
+
+    Only partitions for dates present in data are (re)written, so appending a
+    new day leaves all other partitions untouched. Returns the written dates.
+    """
+    temp_alias = "__date__"
+    partitions = data.with_columns(
+        pl.col(timestamp_col).dt.strftime("%Y-%m-%d").alias(temp_alias)
+    ).partition_by(temp_alias, as_dict=True)
+
+    group_size = row_group_size(data)
+    manifest = read_manifest(root)
+    entries = {
+        tuple(entry[key] for key in PARTITION_KEYS): entry
+        for entry in manifest["partitions"]
+    }
+    for entry in entries.values():
+        if entry["supplier"] == supplier and entry["columns"] != data.columns:
+            raise ValueError(
+                f"{data.columns = } do not match {supplier = } in {root = }: "
+                f"{entry['columns']}."
+            )
+
+    for date, partition in sorted(partitions.items()):
+        partition = partition.drop(temp_alias)
+        path = partition_path(root, supplier, instrument, date)
+        os.makedirs(path, exist_ok=True)
+        partition.write_parquet(
+            os.path.join(path, PARTITION_FILE),
+            statistics=True,
+            row_group_size=group_size,
+        )
+        entries[(supplier, instrument, date)] = {
+            "supplier": supplier,
+            "instrument": instrument,
+            "date": date,
+            "path": os.path.relpath(os.path.join(path, PARTITION_FILE), root),
+            "timestamp_col": timestamp_col,
+            "columns": partition.columns,
+            "statistics": _partition_statistics(partition, timestamp_col),
+        }
+
+    manifest["partitions"] = [entries[key] for key in sorted(entries)]
+    _write_manifest(root, manifest)
+    return sorted(partitions)
+
+
+def read_dataset(
+    root: str,
+    supplier: str,
+    instruments: list[str] | None = None,
+    start: str | None = None,
+    end: str | None = None,
+    columns: list[str] | None = None,
+) -> pl.DataFrame:
+    """Reads only the partitions in [start, end] (YYYY-MM-DD) and the columns needed.
+
+    The PARTITION_KEYS of each partition are added back as columns.
+    """
+    entries = [
+        entry
+        for entry in read_manifest(root)["partitions"]
+        if entry["supplier"] == supplier
+        and (instruments is None or entry["instrument"] in instruments)
+        and (start is None or entry["date"] >= start)
+        and (end is None or entry["date"] <= end)
+    ]
+    if not entries:
+        raise ValueError(
+            f"No partitions in {root = } for {supplier = }, {instruments = }."
+        )
+
+    return pl.concat(
+        [
+            pl.read_parquet(
+                os.path.join(root, entry["path"]), columns=columns
+            ).with_columns([pl.lit(entry[key]).alias(key) for key in PARTITION_KEYS])
+            for entry in entries
+        ]
+    )
@@ -0,0 +1,104 @@
+from inspect import signature
+
+import numpy as np
+
+
+def frac_diff_weights(d: float, window_size: int) -> np.ndarray:
+    """Fixed-width window fractional differencing weights, w_0 = 1."""
+    k = np.arange(1, window_size)
+    return np.cumprod(np.concatenate([[1.0], (k - 1 - d) / k]))
+
+
+def ewma_weights(alpha: float, window_size: int, n_chain: int = 1) -> np.ndarray:
+    """Truncated EWMA weights, applied n_chain times and normalized to sum 1."""
+    weights = alpha * (1 - alpha) ** np.arange(window_size)
+    kernel = weights
+    for _ in range(n_chain - 1):
+        kernel = np.convolve(kernel, weights)[:window_size]
+    return kernel / kernel.sum()
+
+
+def frac_diff_kernel(window_size: int, d: float) -> np.ndarray:
+    return frac_diff_weights(d, window_size)
+
+
+def ewma_kernel(
+    window_size: int, span: float | None = None, n_chain: int = 1
+) -> np.ndarray:
+    # default span keeps the truncated tail weight below exp(-10)
+    span = window_size / 5 if span is None else span
+    return ewma_weights(2 / (span + 1), window_size, n_chain)
+
+
+def fir_kernel(window_size: int, kernel: np.ndarray) -> np.ndarray:
+    if len(kernel) != window_size:
+        raise ValueError(f"{len(kernel) = } does not match {window_size = }.")
+    return np.asarray(kernel, dtype=np.float64)
+
+
+# Function name -> kernel builder (window_size, **kwargs) -> kernel
+FILTERS = {
+    "frac_diff": frac_diff_kernel,
+    "ewma": ewma_kernel,
+    "fir": fir_kernel,
+}
+
+
+def filter_kernel(function: str, window_size: int, kwargs: dict) -> np.ndarray:
+    """Builds the FILTERS kernel of function, checking its kwargs first."""
+    try:
+        signature(FILTERS[function]).bind(window_size, **kwargs)
+    except TypeError as e:
+        raise ValueError(f"Invalid function_kwargs for {function = }: {e}.")
+
+    return FILTERS[function](window_size, **kwargs)
+
+
+def _next_pow2(n: int) -> int:
+    return 1 << max(n - 1, 0).bit_length()
+
+
+def fft_convolve(
+    values: np.ndarray, kernel: np.ndarray, fft_size: int | None = None
+) -> np.ndarray:
+    """Causal FIR filter y[t] = sum_j kernel[j] * x[t - j] along axis 0.
+
+    Uses overlap-save FFT convolution, transforming all blocks and columns of
+    values (n,) or (n, k) at once. Outputs without a full window, or whose
+    window contains a non-finite value, are NaN like the direct formula.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    kernel = np.asarray(kernel, dtype=np.float64)
+    squeeze = values.ndim == 1
+    if squeeze:
+        values = values[:, None]
+
+    n, window_size = len(values), len(kernel)
+    if n == 0:
+        return values[:, 0] if squeeze else values
+    if fft_size is None:
+        fft_size = min(_next_pow2(4 * window_size), _next_pow2(n + window_size - 1))
+    if fft_size < window_size:
+        raise ValueError(f"{fft_size = } smaller than {window_size = }.")
+    step = fft_size - window_size + 1
+
+    # non-finite values poison their windows only, not the whole block
+    finite = np.isfinite(values)
+    values = np.where(finite, values, 0.0)
+
+    n_blocks = -(-n // step)
+    padded = np.zeros((n_blocks * step + window_size - 1, values.shape[1]))
+    padded[window_size - 1 : window_size - 1 + n] = values
+
+    # (n_blocks, k, fft_size) view of overlapping blocks
+    blocks = np.lib.stride_tricks.sliding_window_view(padded, fft_size, axis=0)[::step]
+    spectrum = np.fft.rfft(blocks, axis=-1) * np.fft.rfft(kernel, fft_size)
+    out = np.fft.irfft(spectrum, fft_size, axis=-1)[..., window_size - 1 :]
+    out = out.transpose(0, 2, 1).reshape(-1, values.shape[1])[:n]
+
+    bad = np.cumsum(~finite, axis=0)
+    bad[window_size:] -= bad[:-window_size].copy()
+    out[bad > 0] = np.nan
+    out[: window_size - 1] = np.nan
+
+    return out[:, 0] if squeeze else out
@@ -4,6 +4,11 @@ from re import match
 
 import numpy as np
 import polars as pl
+from polars.datatypes import FLOAT_DTYPES
+
+from ts.calendar import SessionCalendar
+from ts.dataset import PARTITION_KEYS, read_dataset, write_dataset
+from ts.functions import FILTERS, fft_convolve, filter_kernel
 
 logger = logging.getLogger()
 
@@ -23,6 +28,15 @@ class BarAggregation:
     TIME_MINUTES = "time_minutes_agg"
 
 
+class QuarantineReason:
+    MISSING_VALUE = "missing_value"
+    INVALID_PRICE = "invalid_price"
+    UNKNOWN_SIDE = "unknown_side"
+    NON_POSITIVE_QUANTITY = "non_positive_quantity"
+    DUPLICATE = "duplicate"
+    PRICE_SPIKE = "price_spike"
+
+
 class TradeTick:
     @staticmethod
     def alias():
@@ -36,6 +50,7 @@ class TradeTick:
     PRICE = "price"
     TIMESTAMP = "timestamp"
     SIDE = "side"
+    SESSION = "session"
 
 
 class Bar:
@@ -65,6 +80,13 @@ class Bar:
     RETURN = "return"
     LOG_RETURN = "log_return"
 
+    SESSION = "session"
+
+
+def _is_sorted(series: pl.Series) -> bool:
+    values = series.to_physical().to_numpy()
+    return not np.any(values[1:] < values[:-1])
+
 
 def match_col(col_alias: str, col_attr: str, column: str) -> bool:
     """Matches column name against col_alias, col_attr ie: (Bar, Bar.OPEN)"""
@@ -111,6 +133,15 @@ class BarFeature(Bar):
 class BaseSupplier(ABC):
     supplier_type = "BaseSupplier"
 
+    # column holding the point-in-time timestamp of each row
+    timestamp_col: str | None = None
+    data: pl.DataFrame | None = None
+
+    # frame known to be sorted on timestamp_col
+    _sorted_data: pl.DataFrame | None = None
+    _indexed_data: pl.DataFrame | None = None
+    _timestamp_index: np.ndarray | None = None
+
     def __init__(self):
         raise NotImplemented
 
@@ -119,17 +150,222 @@ class BaseSupplier(ABC):
     def instruments(self):
         pass
 
+    @property
+    def is_sorted(self) -> bool:
+        """Whether the current self.data is sorted, reassigning data clears it."""
+        return self.data is not None and self._sorted_data is self.data
+
+    @is_sorted.setter
+    def is_sorted(self, value: bool):
+        self._sorted_data = self.data if value else None
+
+    def to_dataset(self, root: str) -> list[str]:
+        if len(self.instruments) != 1:
+            raise ValueError(
+                f"{self.supplier_type} needs a single instrument to partition, "
+                f"has {self.instruments}."
+            )
+
+        return write_dataset(
+            self.data,
+            root=root,
+            supplier=self.alias,
+            instrument=self.instruments[0],
+            timestamp_col=self.timestamp_col,
+        )
+
+    def _get_timestamp_index(self) -> np.ndarray:
+        """Physical (integer) timestamps of self.data, built once per frame."""
+        if self._indexed_data is self.data:
+            return self._timestamp_index
+
+        if self.data is None or self.timestamp_col is None:
+            raise ValueError(f"{self.supplier_type} has no timestamp index.")
+
+        if not self.is_sorted:
+            if not _is_sorted(self.data[self.timestamp_col]):
+                raise ValueError(
+                    f"{self.supplier_type} data is not sorted by {self.timestamp_col}."
+                )
+            self.is_sorted = True
+
+        self._indexed_data = self.data
+        self._timestamp_index = self.data[self.timestamp_col].to_physical().to_numpy()
+        return self._timestamp_index
+
+    def _to_physical(self, ts: list) -> np.ndarray:
+        """Converts query times to the physical representation of timestamp_col."""
+        return (
+            pl.Series(ts)
+            .cast(self.data[self.timestamp_col].dtype)
+            .to_physical()
+            .to_numpy()
+        )
+
+    def as_of(self, t) -> pl.DataFrame:
+        """Returns the last row with timestamp <= t (empty if none)."""
+        index = self._get_timestamp_index()
+        end = np.searchsorted(index, self._to_physical([t])[0], side="right")
+        return self.data.slice(max(end - 1, 0), min(end, 1))
+
+    def between(self, t1, t2) -> pl.DataFrame:
+        """Returns all rows with t1 <= timestamp <= t2."""
+        index = self._get_timestamp_index()
+        start, end = self._to_physical([t1, t2])
+        start = np.searchsorted(index, start, side="left")
+        end = np.searchsorted(index, end, side="right")
+        return self.data.slice(start, max(end - start, 0))
+
+    def last_n(self, t, n: int) -> pl.DataFrame:
+        """Returns up to n rows preceding and including timestamp t."""
+        index = self._get_timestamp_index()
+        end = np.searchsorted(index, self._to_physical([t])[0], side="right")
+        start = max(end - n, 0)
+        return self.data.slice(start, end - start)
+
+    def as_of_many(self, ts: list) -> pl.DataFrame:
+        """Vectorized as_of: one row per query time, null where none precedes it."""
+        index = self._get_timestamp_index()
+        positions = np.searchsorted(index, self._to_physical(ts), side="right") - 1
+        positions = pl.Series(positions).set_at_idx(np.flatnonzero(positions < 0), None)
+        return self.data.select(pl.all().take(positions))
+
 
 class TickSupplier(BaseSupplier):
     supplier_type = "TickSupplier"
 
-    def __init__(self, instrument: str):
+    def __init__(
+        self, instrument: str, session_calendar: SessionCalendar | None = None
+    ):
         self.instrument = instrument
+        self.alias = f"{SupplierType.TICK}-{instrument}"
+        self.session_calendar = session_calendar or SessionCalendar()
+        self.timestamp_col = TradeTick.TIMESTAMP
         self.data = None
+        self.quarantine = None
+        # (frame, calendar, session ids) of the last with_sessions call
+        self._sessions = (None, None, None)
+        # frame produced by clean()
+        self._clean_data = None
 
     def from_parquet(self, filepath: str):
         self.data = pl.read_parquet(filepath)
 
+    def from_dataset(
+        self,
+        root: str,
+        start: str | None = None,
+        end: str | None = None,
+        columns: list[str] | None = None,
+    ):
+        self.data = read_dataset(
+            root,
+            supplier=self.alias,
+            instruments=[self.instrument],
+            start=start,
+            end=end,
+            columns=columns,
+        ).drop(PARTITION_KEYS)
+
+    @property
+    def is_clean(self) -> bool:
+        """Whether the current self.data was produced by clean()."""
+        return self.data is not None and self._clean_data is self.data
+
+    def clean(
+        self, spike_window: int = 21, spike_threshold: float = 0.05
+    ) -> pl.DataFrame:
+        """Sorts and validates self.data, moving rejected ticks to self.quarantine.
+
+        Rejected ticks keep their original row_nr and get a QuarantineReason:
+        nulls, non-finite prices, sides other than 0/1, non-positive quantities,
+        duplicate (timestamp, price, quantity) prints and prices deviating more
+        than spike_threshold from the centered rolling median of spike_window.
+        """
+        reason = "reason"
+        # integer prices are always finite
+        if self.data[TradeTick.PRICE].dtype in FLOAT_DTYPES:
+            finite_price = pl.col(TradeTick.PRICE).is_finite()
+        else:
+            finite_price = pl.lit(True)
+
+        data = self.data.with_row_count().with_columns(
+            pl.when(
+                pl.col(TradeTick.TIMESTAMP).is_null()
+                | pl.col(TradeTick.PRICE).is_null()
+                | pl.col(TradeTick.QUANTITY).is_null()
+                | pl.col(TradeTick.SIDE).is_null()
+            )
+            .then(QuarantineReason.MISSING_VALUE)
+            .when(~finite_price)
+            .then(QuarantineReason.INVALID_PRICE)
+            .when(~pl.col(TradeTick.SIDE).is_in([0, 1]))
+            .then(QuarantineReason.UNKNOWN_SIDE)
+            .when(pl.col(TradeTick.QUANTITY) <= 0)
+            .then(QuarantineReason.NON_POSITIVE_QUANTITY)
+            .otherwise(None)
+            .alias(reason)
+        )
+        quarantine = [data.filter(pl.col(reason).is_not_null())]
+        data = data.filter(pl.col(reason).is_null())
+
+        if not _is_sorted(data[TradeTick.TIMESTAMP]):
+            data = data.sort([TradeTick.TIMESTAMP, "row_nr"])
+
+        # duplicates share a timestamp, the first print is kept
+        data = data.with_columns(
+            pl.when(
+                pl.col(TradeTick.TIMESTAMP)
+                .cumcount()
+                .over([TradeTick.TIMESTAMP, TradeTick.PRICE, TradeTick.QUANTITY])
+                > 0
+            )
+            .then(QuarantineReason.DUPLICATE)
+            .otherwise(None)
+            .alias(reason)
+        )
+        quarantine.append(data.filter(pl.col(reason).is_not_null()))
+        data = data.filter(pl.col(reason).is_null())
+
+        median = pl.col(TradeTick.PRICE).rolling_median(
+            spike_window, min_periods=1, center=True
+        )
+        data = data.with_columns(
+            pl.when(
+                (pl.col(TradeTick.PRICE) - median).abs()
+                > spike_threshold * median.abs()
+            )
+            .then(QuarantineReason.PRICE_SPIKE)
+            .otherwise(None)
+            .alias(reason)
+        )
+        quarantine.append(data.filter(pl.col(reason).is_not_null()))
+        data = data.filter(pl.col(reason).is_null())
+
+        self.data = data.drop(["row_nr", reason]).with_columns(
+            pl.col(TradeTick.TIMESTAMP).set_sorted()
+        )
+        self.is_sorted = True
+        self._clean_data = self.data
+        self.quarantine = pl.concat(quarantine).sort("row_nr")
+        return self.quarantine
+
+    def with_sessions(self) -> pl.DataFrame:
+        """Returns self.data with a TradeTick.SESSION column, leaving self.data as is.
+
+        Session ids are computed once per frame and session_calendar. Session
+        columns not computed here, e.g. loaded with the data, are replaced.
+        """
+        data, calendar, sessions = self._sessions
+        if data is not self.data or calendar is not self.session_calendar:
+            sessions = self.data.select(
+                self.session_calendar.session_id(TradeTick.TIMESTAMP).alias(
+                    TradeTick.SESSION
+                )
+            ).to_series()
+            self._sessions = (self.data, self.session_calendar, sessions)
+        return self.data.with_columns(sessions)
+
     @property
     def instruments(self) -> list[str]:
         return [self.instrument]
@@ -140,16 +376,12 @@ class BarSupplier(BaseSupplier):
 
     def __init__(self, supplier: TickSupplier, bar_aggregation: str, size: int):
         self.supplier = supplier
-        self.instrument = supplier.instrument
-        self.bar_aggregation = bar_aggregation
-        self.size = size
-        self.alias = f"{SupplierType.BAR}-{self.instrument}-{bar_aggregation}-{size}"
+        self._set_attributes(supplier.instrument, bar_aggregation, size)
 
         match bar_aggregation:
             case BarAggregation.VOLUME:
-                self.index = f"{self.alias}-{Bar.VOLUME}"
                 self.data = self._aggregate_bar(
-                    data=self.supplier.data,
+                    data=self.supplier.with_sessions(),
                     bar_aggregation=bar_aggregation,
                     size=self.size,
                 ).with_columns(
@@ -163,9 +395,8 @@ class BarSupplier(BaseSupplier):
                 BarAggregation.TIME_SECONDS,
                 BarAggregation.TIME_MINUTES,
             ):
-                self.index = f"{self.alias}-{Bar.TIMESTAMP}"
                 self.data = self._aggregate_bar(
-                    data=self.supplier.data,
+                    data=self.supplier.with_sessions(),
                     bar_aggregation=bar_aggregation,
                     size=self.size,
                 )
@@ -184,6 +415,23 @@ class BarSupplier(BaseSupplier):
             ]
         )
 
+        # _aggregate_bar sorts on the bar timestamp
+        if not _is_sorted(self.data[self.timestamp_col]):
+            raise RuntimeError(f"{self.alias} bars are not sorted by timestamp.")
+        self.data = self.data.with_columns(pl.col(self.timestamp_col).set_sorted())
+        self.is_sorted = True
+
+    def _set_attributes(self, instrument: str, bar_aggregation: str, size: int):
+        self.instrument = instrument
+        self.bar_aggregation = bar_aggregation
+        self.size = size
+        self.alias = f"{SupplierType.BAR}-{self.instrument}-{bar_aggregation}-{size}"
+        self.timestamp_col = f"{self.alias}-{Bar.TIMESTAMP}"
+        if bar_aggregation == BarAggregation.VOLUME:
+            self.index = f"{self.alias}-{Bar.VOLUME}"
+        else:
+            self.index = f"{self.alias}-{Bar.TIMESTAMP}"
+
     def _aggregate_bar(
         self, data: pl.DataFrame, bar_aggregation: str, size: int
     ) -> pl.DataFrame:
@@ -216,8 +464,12 @@ class BarSupplier(BaseSupplier):
             ((pl.col(TradeTick.SIDE) == 1) * pl.col(TradeTick.QUANTITY))
             .sum()
             .alias(f"{self.alias}-{Bar.BID_SIZE}"),
+            pl.col(TradeTick.SESSION).last().alias(f"{self.alias}-{Bar.SESSION}"),
         ]
 
+        # ticks outside of trading sessions (breaks, weekends, holidays)
+        data = data.filter(pl.col(TradeTick.SESSION).is_not_null())
+
         match bar_aggregation:
             case BarAggregation.VOLUME:
                 temp_alias = f"{self.alias}-{Bar.__INDEX__}"
@@ -230,31 +482,40 @@ class BarSupplier(BaseSupplier):
                             * size
                         ).alias(temp_alias)
                     )
-                    .groupby(temp_alias)
+                    .groupby(temp_alias, maintain_order=self.supplier.is_clean)
                     .agg(agg_args)
-                    .sort(f"{self.alias}-{Bar.TIMESTAMP}")
                     .drop([temp_alias])
                 )
+                # cleaned ticks are sorted with positive quantities, so the
+                # cumsum buckets and thus the groups are in timestamp order
+                if not self.supplier.is_clean:
+                    data = data.sort(f"{self.alias}-{Bar.TIMESTAMP}")
                 return data
 
             case BarAggregation.TIME_MILLISECONDS:
                 data = (
                     data.groupby_dynamic(
-                        TradeTick.TIMESTAMP, every=f"{size}ms", period=f"{size}ms"
+                        TradeTick.TIMESTAMP,
+                        every=f"{size}ms",
+                        period=f"{size}ms",
+                        by=TradeTick.SESSION,
                     )
                     .agg(agg_args)
                     .sort(f"{self.alias}-{Bar.TIMESTAMP}")
-                    .drop(TradeTick.TIMESTAMP)
+                    .drop([TradeTick.TIMESTAMP, TradeTick.SESSION])
                 )
                 return data
             case BarAggregation.TIME_SECONDS:
                 data = (
                     data.groupby_dynamic(
-                        TradeTick.TIMESTAMP, every=f"{size}s", period=f"{size}s"
+                        TradeTick.TIMESTAMP,
+                        every=f"{size}s",
+                        period=f"{size}s",
+                        by=TradeTick.SESSION,
                     )
                     .agg(agg_args)
                     .sort(f"{self.alias}-{Bar.TIMESTAMP}")
-                    .drop(TradeTick.TIMESTAMP)
+                    .drop([TradeTick.TIMESTAMP, TradeTick.SESSION])
                 )
                 return data
             case BarAggregation.TIME_MINUTES:
@@ -263,10 +524,11 @@ class BarSupplier(BaseSupplier):
                         TradeTick.TIMESTAMP,
                         every=f"{60 * size}s",
                         period=f"{60 * size}s",
+                        by=TradeTick.SESSION,
                     )
                     .agg(agg_args)
                     .sort(f"{self.alias}-{Bar.TIMESTAMP}")
-                    .drop(TradeTick.TIMESTAMP)
+                    .drop([TradeTick.TIMESTAMP, TradeTick.SESSION])
                 )
                 return data
             case _:
@@ -286,6 +548,31 @@ class BarSupplier(BaseSupplier):
     def from_parquet(self, filepath: str):
         self.data = pl.read_parquet(filepath)
 
+    @classmethod
+    def from_dataset(
+        cls,
+        root: str,
+        instrument: str,
+        bar_aggregation: str,
+        size: int,
+        start: str | None = None,
+        end: str | None = None,
+        columns: list[str] | None = None,
+    ) -> "BarSupplier":
+        """Loads bars written by to_dataset without the ticks they were built from."""
+        bar_supplier = cls.__new__(cls)
+        bar_supplier.supplier = None
+        bar_supplier._set_attributes(instrument, bar_aggregation, size)
+        bar_supplier.data = read_dataset(
+            root,
+            supplier=bar_supplier.alias,
+            instruments=[instrument],
+            start=start,
+            end=end,
+            columns=columns,
+        ).drop(PARTITION_KEYS)
+        return bar_supplier
+
     def get_col(self, col_type: Bar | BarFeature, type_attr: str) -> str | None:
         columns = [
             col
@@ -302,12 +589,13 @@ class BarFeatureSupplier(BaseSupplier):
     supplier_type = "BarFeatureSupplier"
 
     def __init__(self, supplier: BarSupplier):
-        self.supplier = supplier
-        self.instrument = supplier.instrument
-        self.bar_aggregation = supplier.bar_aggregation
-        self.size = supplier.size
-        self.alias = f"{SupplierType.BAR_FEATURES}-{supplier.alias}"
-        self.index = supplier.index
+        self._set_attributes(supplier)
+
+        if f"{supplier.alias}-{Bar.SESSION}" in supplier.data.columns:
+            session = pl.col(f"{supplier.alias}-{Bar.SESSION}")
+        else:
+            # bars written before sessions were added, group by UTC day
+            session = pl.col(f"{supplier.alias}-{Bar.TIMESTAMP}").dt.epoch(tu="d")
 
         self.data = supplier.data.with_columns(
             [
@@ -369,6 +657,11 @@ class BarFeatureSupplier(BaseSupplier):
                     pl.col(f"{supplier.alias}-{Bar.BID_SIZE}")
                     - pl.col(f"{supplier.alias}-{Bar.ASK_SIZE}")
                 ).alias(f"{self.alias}-{BarFeature.OFI}"),
+                # resets at the start of each trading session
+                pl.col(f"{self.alias}-{BarFeature.VOLUME_DELTA}")
+                .cumsum()
+                .over(session)
+                .alias(f"{self.alias}-{BarFeature.CUMULATIVE_VOLUME_DELTA}"),
                 (
                     (
                         pl.col(f"{supplier.alias}-{Bar.BID_SIZE}")
@@ -416,19 +709,66 @@ class BarFeatureSupplier(BaseSupplier):
                 pl.when(pl.col(self.get_col(Bar, Bar.RETURN)) > 0)
                 .then(
                     np.sqrt(np.square(pl.col(self.get_col(Bar, Bar.RETURN))).cumsum())
-                    .over(pl.col(self.get_col(Bar, Bar.TIMESTAMP)).dt.epoch(tu="d"))
+                    .over(session)
                     .alias(f"{self.alias}-{BarFeature.POS_REALIZED_VARIANCE}")
                 )
                 .otherwise(0),
                 pl.when(pl.col(self.get_col(Bar, Bar.RETURN)) < 0)
                 .then(
                     np.sqrt(np.square(pl.col(self.get_col(Bar, Bar.RETURN))).cumsum())
-                    .over(pl.col(self.get_col(Bar, Bar.TIMESTAMP)).dt.epoch(tu="d"))
+                    .over(session)
                     .alias(f"{self.alias}-{BarFeature.NEG_REALIZED_VARIANCE}")
                 )
                 .otherwise(0),
             ]
         )
+        # with_columns keeps the row order of the bars
+        self.is_sorted = supplier.is_sorted
+
+    def _set_attributes(self, supplier: BarSupplier):
+        self.supplier = supplier
+        self.instrument = supplier.instrument
+        self.bar_aggregation = supplier.bar_aggregation
+        self.size = supplier.size
+        self.alias = f"{SupplierType.BAR_FEATURES}-{supplier.alias}"
+        self.index = supplier.index
+        self.timestamp_col = supplier.timestamp_col
+
+    @classmethod
+    def from_dataset(
+        cls,
+        root: str,
+        instrument: str,
+        bar_aggregation: str,
+        size: int,
+        start: str | None = None,
+        end: str | None = None,
+        columns: list[str] | None = None,
+    ) -> "BarFeatureSupplier":
+        """Loads bar features written by to_dataset without rebuilding them."""
+        bar_supplier = BarSupplier.__new__(BarSupplier)
+        bar_supplier.supplier = None
+        bar_supplier._set_attributes(instrument, bar_aggregation, size)
+
+        feature_supplier = cls.__new__(cls)
+        feature_supplier._set_attributes(bar_supplier)
+        feature_supplier.data = read_dataset(
+            root,
+            supplier=feature_supplier.alias,
+            instruments=[instrument],
+            start=start,
+            end=end,
+            columns=columns,
+        ).drop(PARTITION_KEYS)
+        # bar columns are stored alongside the features
+        bar_supplier.data = feature_supplier.data.select(
+            [
+                col
+                for col in feature_supplier.data.columns
+                if col.startswith(f"{bar_supplier.alias}-")
+            ]
+        )
+        return feature_supplier
 
     @property
     def instruments(self) -> list[str]:
@@ -498,6 +838,7 @@ class MultiplexSupplier(BaseSupplier):
         left_index_col = left_supplier.index
 
         self.index = left_index_col
+        self.timestamp_col = left_supplier.timestamp_col
 
         self.data = left_supplier.data
         self._instruments.append(left_supplier.instrument)
@@ -509,6 +850,8 @@ class MultiplexSupplier(BaseSupplier):
             if supplier.instrument not in self._instruments:
                 self._instruments.append(supplier.instrument)
         self.data = self.data.fill_null(strategy="forward")
+        # join_asof keeps the row order of the left supplier
+        self.is_sorted = left_supplier.is_sorted
 
     @property
     def instruments(self) -> list[str]:
@@ -535,6 +878,11 @@ class MultiplexSupplier(BaseSupplier):
 class Function:
     Z_SCORE = "z_score"
 
+    # long FIR filters, kernels are built by ts.functions.FILTERS
+    FRAC_DIFF = "frac_diff"
+    EWMA = "ewma"
+    FIR = "fir"
+
     @staticmethod
     def alias():
         return SupplierType.ROLLING_FEATURES
@@ -557,14 +905,28 @@ class RollingFeatureSupplier(BaseSupplier):
         type_attributes: list[str],
         functions: list[str],
         window_size: int = 10,
+        function_kwargs: dict[str, dict] | None = None,
     ):
-        self.alias = SupplierType.MULTIPLEX
+        self.alias = f"{SupplierType.ROLLING_FEATURES}-{supplier.alias}"
+        self._instruments = supplier.instruments
+        self.timestamp_col = supplier.timestamp_col
         self.data = supplier.data
 
         with_columns_arg = []
+        # FILTERS columns, convolved together per function
+        filter_columns = {}
         if isinstance(supplier, BarFeatureSupplier):
             for function in functions:
                 for type_attr in type_attributes:
+                    if function in FILTERS:
+                        # filters also apply to bars, e.g. Bar.CLOSE
+                        try:
+                            column = supplier.get_col(BarFeature, type_attr)
+                        except ValueError:
+                            column = supplier.get_col(Bar, type_attr)
+                        filter_columns.setdefault(function, []).append(column)
+                        continue
+
                     column = supplier.get_col(BarFeature, type_attr)
 
                     try:
@@ -581,6 +943,12 @@ class RollingFeatureSupplier(BaseSupplier):
                 for type_attr in type_attributes:
                     columns = supplier.get_cols(BarFeature, type_attr)
 
+                    if function in FILTERS:
+                        # filters also apply to bars, e.g. Bar.CLOSE
+                        columns = columns or supplier.get_cols(Bar, type_attr)
+                        filter_columns.setdefault(function, []).extend(columns)
+                        continue
+
                     try:
                         func = getattr(Function, function)
                     except AttributeError:
@@ -594,11 +962,25 @@ class RollingFeatureSupplier(BaseSupplier):
         else:
             raise ValueError(f"{supplier = } type not supported.")
 
+        for function, columns in filter_columns.items():
+            kernel = filter_kernel(
+                function, window_size, (function_kwargs or {}).get(function, {})
+            )
+            filtered = fft_convolve(self.data.select(columns).to_numpy(), kernel)
+            with_columns_arg += [
+                pl.Series(
+                    f"{Function.alias()}-{column}-{function}-{window_size}",
+                    filtered[:, i],
+                ).fill_nan(None)
+                for i, column in enumerate(columns)
+            ]
+
         self.data = self.data.with_columns(with_columns_arg)
+        self.is_sorted = supplier.is_sorted
 
     @property
     def instruments(self) -> list[str]:
-        return []
+        return self._instruments
 
     @property
     def bar_features(self) -> list[str]: